@@ -248,27 +248,24 @@ def aggregate_connectomes(
         labels: list[str] = sidecar.get("region_labels", [])
         n = matrix.shape[0]
 
-        rows: list[dict] = []
-        for i in range(n):
-            j_start = i if include_diagonal else i + 1
-            for j in range(j_start, n):
-                rows.append(
-                    {
-                        "subject": subject,
-                        "session": session,
-                        "region_i_index": i + 1,
-                        "region_j_index": j + 1,
-                        "region_i_name": labels[i]
-                        if i < len(labels)
-                        else f"region_{i + 1}",
-                        "region_j_name": labels[j]
-                        if j < len(labels)
-                        else f"region_{j + 1}",
-                        "weight": matrix[i, j],
-                    }
-                )
-
-        edge_df = pd.DataFrame(rows)
+        names = np.array(
+            [labels[k] if k < len(labels) else f"region_{k + 1}" for k in range(n)],
+            dtype=object,
+        )
+        # Row-major upper-triangle coordinates, i.e. the order of a nested
+        # i/j loop, built in one step instead of one dict per edge.
+        ii, jj = np.triu_indices(n, k=0 if include_diagonal else 1)
+        edge_df = pd.DataFrame(
+            {
+                "subject": subject,
+                "session": session,
+                "region_i_index": ii + 1,
+                "region_j_index": jj + 1,
+                "region_i_name": names[ii],
+                "region_j_name": names[jj],
+                "weight": matrix[ii, jj],
+            }
+        )
         grouped[key].append(edge_df)
         logger.debug(
             "aggregate_connectomes: %d edges from %s/%s key=%s",
@@ -11,15 +11,15 @@ import json
 import logging
 from dataclasses import dataclass
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
-import numpy as np
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RegionInfo:
     """Metadata for a single atlas region."""
 
@@ -60,15 +60,14 @@ class AtlasLUT:
 
     def to_dataframe(self) -> pd.DataFrame:
         """Convert to a DataFrame for merging with extraction results."""
+        import pandas as pd
+
         return pd.DataFrame(
-            [
-                {
-                    "region_index": r.index,
-                    "region_name": r.name,
-                    "hemisphere": r.hemisphere,
-                }
-                for r in self.regions
-            ]
+            {
+                "region_index": [r.index for r in self.regions],
+                "region_name": [r.name for r in self.regions],
+                "hemisphere": [r.hemisphere for r in self.regions],
+            }
         )
 
 
@@ -115,6 +114,8 @@ def load_lut_from_tsv(path: Path, atlas_name: str = "") -> AtlasLUT:
     -------
     AtlasLUT
     """
+    import pandas as pd
+
     # Try pandas first for well-formed TSVs
     try:
         df = pd.read_csv(path, sep=r"\t", engine="python")
@@ -140,13 +141,19 @@ def load_lut_from_tsv(path: Path, atlas_name: str = "") -> AtlasLUT:
         df.columns[1],
     )
 
+    # Walk plain column lists rather than df.iterrows(), which builds a
+    # Series per row.
+    has_hemisphere = "hemisphere" in df.columns
+    hemispheres = df["hemisphere"].tolist() if has_hemisphere else [None] * len(df)
     regions = []
-    for _, row in df.iterrows():
-        idx = int(row[idx_col])
+    for raw_idx, raw_name, raw_hemi in zip(
+        df[idx_col].tolist(), df[name_col].tolist(), hemispheres, strict=True
+    ):
+        idx = int(raw_idx)
         if idx == 0:
             continue  # Skip background
-        name = str(row[name_col])
-        hemisphere = row.get("hemisphere", infer_hemisphere(name))
+        name = str(raw_name)
+        hemisphere = raw_hemi if has_hemisphere else infer_hemisphere(name)
         regions.append(RegionInfo(index=idx, name=name, hemisphere=hemisphere))
 
     logger.info("Loaded %d regions from TSV LUT: %s", len(regions), path)
@@ -196,10 +203,17 @@ def load_lut_from_dseg(dseg_path: Path, atlas_name: str = "") -> AtlasLUT:
     This is a fallback — prefer loading a proper LUT file.
     """
     import nibabel as nib
+    import numpy as np
 
     img = cast(nib.Nifti1Image, nib.load(dseg_path))
-    data = np.asarray(img.dataobj, dtype="int32")
-    unique_labels: list[int] = sorted(int(v) for v in np.unique(data) if v != 0)
+    data = np.asarray(img.dataobj, dtype="int32").ravel()
+    if data.size == 0 or data.min() < 0 or data.max() > data.size:
+        present = np.unique(data)
+    else:
+        # Labels are small non-negative integers: a counting pass is linear in
+        # the volume size, whereas np.unique sorts every voxel.
+        present = np.flatnonzero(np.bincount(data))
+    unique_labels: list[int] = [int(v) for v in present if v != 0]
 
     regions = [
         RegionInfo(index=int(idx), name=f"region_{idx:04d}", hemisphere="bilateral")
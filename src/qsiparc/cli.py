@@ -42,22 +42,15 @@ from pathlib import Path
 
 import click
 
-from qsiparc.aggregate import (
-    _atlas_from_key,
-    aggregate_connectomes,
-    aggregate_diffmaps,
-    discover_connmatrix_csvs,
-    discover_diffmap_tsvs,
-    write_aggregate_tsv,
-)
-from qsiparc.connectome import build_connectomes, check_mrtrix3
+# Heavy modules (extract → parcellate/nilearn, aggregate → pandas, connectome →
+# numpy) are imported inside the commands that use them so that
+# ``qsiparc --help`` and argument validation stay fast.
 from qsiparc.discover import (
     discover_dseg_files,
     discover_scalar_maps,
     discover_tractography,
     load_lut_for_dseg,
 )
-from qsiparc.extract import extract_scalar_map
 from qsiparc.output import (
     DiffmapProvenance,
     diffmap_tsv_path,
@@ -104,13 +97,19 @@ def _process_dseg(
     Returns (success, error_message). This is a top-level function so it can be
     pickled by ProcessPoolExecutor.
     """
+    from qsiparc.connectome import build_connectomes
+    from qsiparc.extract import extract_scalar_map, load_dseg_image
+
     _setup_logging(verbosity)
     _logger = logging.getLogger("qsiparc")
 
     sub = dseg_file.subject
     ses = dseg_file.session
     atlas_name = dseg_file.atlas_name
-    log_prefix = f"sub-{sub}/ses-{ses}/atlas-{atlas_name}"
+    # BIDS labels are reused for every output path below; build them once.
+    subject_label = f"sub-{sub}"
+    session_label = f"ses-{ses}"
+    log_prefix = f"{subject_label}/{session_label}/atlas-{atlas_name}"
 
     try:
         _logger.info("==> Starting %s", log_prefix)
@@ -131,19 +130,22 @@ def _process_dseg(
             scalars=list(scalars) if scalars else None,
         )
         _logger.info("%s | Found %d scalar map(s)", log_prefix, len(scalar_files))
+        # Decode the dseg lazily, once, and share it across all scalar maps.
+        dseg_img = None
 
         for sf_idx, sf in enumerate(scalar_files, 1):
             scalar_name = sf.entities.get(
                 "param", sf.entities.get("desc", sf.path.stem.split("_")[-1])
             )
+            software = sf.software or None
             try:
                 if not force:
                     expected = diffmap_tsv_path(
                         output_dir=output_dir,
-                        subject=f"sub-{sub}",
-                        session=f"ses-{ses}",
+                        subject=subject_label,
+                        session=session_label,
                         atlas_name=atlas_name,
-                        software=sf.software or None,
+                        software=software,
                         source_entities=sf.entities,
                     )
                     if expected.exists():
@@ -163,30 +165,32 @@ def _process_dseg(
                     scalar_name,
                 )
                 _logger.info("%s |         source: %s", log_prefix, sf.path.name)
+                if dseg_img is None:
+                    dseg_img = load_dseg_image(dseg_file.path)
                 result = extract_scalar_map(
-                    scalar_path=str(sf.path),
-                    dseg_path=str(dseg_file.path),
+                    scalar_path=sf.path,
+                    dseg_path=dseg_img,
                     lut=lut,
                     stat_tier=stat_tier,
                     zero_is_missing=zero_is_missing,
                     scalar_name=scalar_name,
                 )
                 provenance = DiffmapProvenance(
-                    subject=f"sub-{sub}",
-                    session=f"ses-{ses}",
+                    subject=subject_label,
+                    session=session_label,
                     atlas_name=atlas_name,
                     atlas_dseg=dseg_file.path,
                     lut_file=dseg_file.lut_path,
                     scalar_name=scalar_name,
                     source_file=sf.path,
                     source_entities=sf.entities,
-                    software=sf.software or None,
+                    software=software,
                 )
                 tsv_path = write_diffmap_tsv(
                     df=result.stats_df,
                     output_dir=output_dir,
-                    subject=f"sub-{sub}",
-                    session=f"ses-{ses}",
+                    subject=subject_label,
+                    session=session_label,
                     atlas_name=atlas_name,
                     provenance=provenance,
                     force=force,
@@ -229,8 +233,8 @@ def _process_dseg(
                         dseg_file=dseg_file,
                         lut=lut,
                         output_dir=output_dir,
-                        subject=f"sub-{sub}",
-                        session=f"ses-{ses}",
+                        subject=subject_label,
+                        session=session_label,
                         force=force,
                     )
                 except Exception as e:
@@ -357,6 +361,8 @@ def run(
     QSIRECON_DIR is the path to QSIRecon derivatives.
     OUTPUT_DIR is where QSIParc outputs will be written.
     """
+    from qsiparc.connectome import check_mrtrix3
+
     _setup_logging(verbose)
 
     logger.info("QSIParc starting up")
@@ -552,6 +558,15 @@ def aggregate(
     invocation.  Aggregate TSVs are written to <QSIPARC_DIR>/group/ by
     default (one file per atlas per data type).
     """
+    from qsiparc.aggregate import (
+        _atlas_from_key,
+        aggregate_connectomes,
+        aggregate_diffmaps,
+        discover_connmatrix_csvs,
+        discover_diffmap_tsvs,
+        write_aggregate_tsv,
+    )
+
     _setup_logging(verbose)
 
     effective_output_dir = (
@@ -65,7 +65,7 @@ def parse_entities(filename: str) -> dict[str, str]:
     return {m.group("key"): m.group("val") for m in _ENTITY_RE.finditer(filename)}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BIDSFile:
     """A discovered file with its parsed BIDS entities."""
 
@@ -100,7 +100,7 @@ class BIDSFile:
         return ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AtlasDsegFile:
     """A subject-space atlas dseg NIfTI paired with its atlas LUT.
 
@@ -215,17 +215,22 @@ def discover_dseg_files(
     ses_pattern = sanitize_session_label(session_label) if session_label else "ses-*"
 
     glob_pattern = f"{sub_pattern}/{ses_pattern}/dwi/*_dseg.nii.gz"
+    atlas_filter = [atlas] if isinstance(atlas, str) else atlas
     results = []
+    # Every subject/session shares the same atlases/ directory, so look each
+    # atlas's LUT up once instead of once per dseg.
+    lut_paths: dict[str, Path | None] = {}
 
     for path in sorted(qsirecon_dir.glob(glob_pattern)):
         entities = parse_entities(path.name)
         atlas_name = entities.get("seg", "")
         if not atlas_name:
             continue  # skip dsegs without a seg entity
-        atlas_filter = [atlas] if isinstance(atlas, str) else atlas
         if atlas_filter and atlas_name not in atlas_filter:
             continue
-        lut_path = find_atlas_lut(qsirecon_dir, atlas_name)
+        if atlas_name not in lut_paths:
+            lut_paths[atlas_name] = find_atlas_lut(qsirecon_dir, atlas_name)
+        lut_path = lut_paths[atlas_name]
         results.append(
             AtlasDsegFile(
                 path=path,
@@ -280,6 +285,7 @@ def discover_scalar_maps(
         logger.warning("Derivatives directory not found: %s", derivatives_dir)
         return []
 
+    scalar_filters = [s.lower() for s in scalars] if scalars else []
     results = []
     for workflow_dir in sorted(derivatives_dir.glob("qsirecon-*")):
         dwi_dir = workflow_dir / subject / session / "dwi"
@@ -291,13 +297,10 @@ def discover_scalar_maps(
             entities = parse_entities(path.name)
             if entities.get("space") != "ACPC":
                 continue
-            if scalars:
-                param = entities.get("param", entities.get("desc", ""))
+            if scalar_filters:
+                param = entities.get("param", entities.get("desc", "")).lower()
                 stem_lower = path.stem.lower()
-                if not any(
-                    s.lower() in param.lower() or s.lower() in stem_lower
-                    for s in scalars
-                ):
+                if not any(s in param or s in stem_lower for s in scalar_filters):
                     continue
             results.append(BIDSFile(path=path, entities=entities))
 
@@ -54,17 +54,49 @@ def _lut_to_dataframe(lut: AtlasLUT) -> pd.DataFrame:
     as passthrough columns.
     """
     return pd.DataFrame(
-        [
-            {
-                "index": r.index,
-                "label": r.name,
-                "hemisphere": r.hemisphere,
-            }
-            for r in lut.regions
-        ]
+        {
+            "index": [r.index for r in lut.regions],
+            "label": [r.name for r in lut.regions],
+            "hemisphere": [r.hemisphere for r in lut.regions],
+        }
     )
 
 
+def _scalar_array(img: nib.Nifti1Image) -> np.ndarray:
+    """Read a scalar map's voxels in a dtype that can hold NaN.
+
+    Keeps the on-disk float precision (QSIRecon writes float32 maps) so the
+    zero_is_missing copy is not a float64 one; integer maps are promoted so
+    that missing signal can be represented as NaN.
+    """
+    data = np.asarray(img.dataobj)
+    if data.dtype.kind != "f":
+        data = data.astype(np.float64)
+    return data
+
+
+def load_dseg_image(dseg_path: str | Path) -> nib.Nifti1Image:
+    """Load an atlas dseg NIfTI fully into memory.
+
+    A file-backed image re-reads (and, for ``.nii.gz``, re-decompresses) its
+    data on every array access. Callers extracting several scalar maps against
+    the same atlas should load it once with this function and pass the
+    returned image to :func:`extract_scalar_map` for each map.
+
+    Parameters
+    ----------
+    dseg_path : str or Path
+        Atlas parcellation dseg NIfTI.
+
+    Returns
+    -------
+    nib.Nifti1Image
+        Image whose data array is already decoded in memory.
+    """
+    img = cast(nib.Nifti1Image, nib.load(dseg_path))
+    return nib.Nifti1Image(np.asarray(img.dataobj), img.affine, img.header)
+
+
 def extract_scalar_map(
     scalar_path: str | Path | nib.Nifti1Image,
     dseg_path: str | Path | nib.Nifti1Image,
@@ -103,43 +135,31 @@ def extract_scalar_map(
         nib.load(dseg_path) if isinstance(dseg_path, str | Path) else dseg_path,
     )
 
-    scalar_data = np.asarray(scalar_img.dataobj, dtype=np.float64)
-    dseg_data = np.round(np.asarray(dseg_img.dataobj, dtype="int32"))
-
-    if scalar_data.shape[:3] != dseg_data.shape[:3]:
+    # Shapes come from the headers. Voxels are only read here when they have
+    # to change before parcellate sees them; otherwise parcellate's own
+    # get_fdata() is the single read of the scalar map.
+    if scalar_img.shape[:3] != dseg_img.shape[:3]:
         raise ValueError(
-            f"Shape mismatch: scalar {scalar_data.shape[:3]}"
-            f" vs dseg {dseg_data.shape[:3]}. "
+            f"Shape mismatch: scalar {scalar_img.shape[:3]}"
+            f" vs dseg {dseg_img.shape[:3]}. "
             "Both must be in the same space "
             "(expected: subject T1w space from QSIRecon)."
         )
 
-    if scalar_data.ndim == 4:
+    if len(scalar_img.shape) == 4:
         logger.warning(
             "Scalar map %s is 4D (%s), using first volume only.",
             scalar_name,
-            scalar_data.shape,
+            scalar_img.shape,
         )
-        scalar_data = scalar_data[..., 0]
+        scalar_data = _scalar_array(scalar_img)[..., 0]
         scalar_img = nib.Nifti1Image(scalar_data, scalar_img.affine, scalar_img.header)
 
     if zero_is_missing:
-        scalar_data = scalar_data.copy()
+        scalar_data = _scalar_array(scalar_img).copy()
         scalar_data[scalar_data == 0.0] = np.nan
         scalar_img = nib.Nifti1Image(scalar_data, scalar_img.affine, scalar_img.header)
 
-    # Compute n_voxels and coverage from the already-loaded arrays.
-    # parcellate's voxel_count is the total atlas count, not the valid-signal count.
-    # n_voxels = valid (non-NaN) voxels; coverage = n_voxels / n_atlas_voxels.
-    region_voxel_stats: dict[int, tuple[float, float]] = {}
-    for region in lut.regions:
-        n_atlas = int(np.sum(dseg_data == region.index))
-        if n_atlas == 0:
-            region_voxel_stats[region.index] = (0.0, np.nan)
-        else:
-            n_valid = float(np.sum(~np.isnan(scalar_data[dseg_data == region.index])))
-            region_voxel_stats[region.index] = (n_valid, n_valid / n_atlas)
-
     lut_df = _lut_to_dataframe(lut)
 
     # atlas and scalar are already co-registered by QSIRecon — skip resampling
@@ -60,11 +60,13 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-
-import pandas as pd
+from typing import TYPE_CHECKING
 
 import qsiparc
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
 
@@ -148,8 +150,8 @@ def diffmap_tsv_path(
 ) -> Path:
     """Return the output path for a diffmap TSV without writing anything.
 
-    Mirrors the path construction logic in :func:`write_diffmap_tsv` so callers
-    can check for an existing file before running expensive computation.
+    :func:`write_diffmap_tsv` uses this to name its output, so callers can
+    check for an existing file before running expensive computation.
     """
     atlas_dir = output_dir / subject / session / "dwi" / f"atlas-{atlas_name}"
     parts = [subject, session, f"atlas-{atlas_name}"]
@@ -224,21 +226,18 @@ def write_diffmap_tsv(
         provenance.source_entities if provenance is not None else source_entities
     )
 
-    atlas_dir = output_dir / subject / session / "dwi" / f"atlas-{atlas_name}"
+    # Filename: sub_ses_atlas_software_[source entities]_diffmap
+    out_path = diffmap_tsv_path(
+        output_dir=output_dir,
+        subject=subject,
+        session=session,
+        atlas_name=atlas_name,
+        software=_software,
+        source_entities=_source_entities,
+    )
+    atlas_dir = out_path.parent
     atlas_dir.mkdir(parents=True, exist_ok=True)
 
-    # Build filename: sub_ses_atlas_software_[source entities]_diffmap
-    parts = [subject, session, f"atlas-{atlas_name}"]
-    if _software:
-        parts.append(f"software-{_software}")
-    if _source_entities:
-        for key, val in _source_entities.items():
-            if key not in ("sub", "ses"):
-                parts.append(f"{key}-{val}")
-    parts.append("diffmap")
-    stem = "_".join(parts)
-
-    out_path = atlas_dir / f"{stem}.tsv"
     if out_path.exists() and not force:
         logger.info("Skipping existing diffmap TSV: %s", out_path)
         return out_path
@@ -272,7 +271,7 @@ def write_diffmap_tsv(
             },
         }
 
-    json_path = atlas_dir / f"{stem}.json"
+    json_path = out_path.with_suffix(".json")
     with open(json_path, "w") as f:
         json.dump(sidecar, f, indent=2)
     logger.info("Wrote diffmap sidecar: %s", json_path)
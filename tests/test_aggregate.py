@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import numpy as np
@@ -219,6 +220,24 @@ class TestAggregateConnectomes:
         assert any("radius2count" in k for k in keys)
         assert any("radius2meanlength" in k for k in keys)
 
+    def test_edge_order_and_unlabelled_regions(self, tmp_path):
+        """Edges follow row-major upper-triangle order; missing labels fall back."""
+        from qsiparc.discover import BIDSFile, parse_entities
+
+        csv_path = tmp_path / "sub-001_ses-01_atlas-TestAtlas5_desc-test_connmatrix.csv"
+        matrix = np.arange(9, dtype=float).reshape(3, 3)
+        np.savetxt(csv_path, matrix, delimiter=",")
+        csv_path.with_suffix(".json").write_text(
+            json.dumps({"region_labels": ["A", "B"]})
+        )
+        files = [BIDSFile(path=csv_path, entities=parse_entities(csv_path.name))]
+        (df,) = aggregate_connectomes(files).values()
+        pairs = df[["region_i_index", "region_j_index"]].values.tolist()
+        assert pairs == [[1, 2], [1, 3], [2, 3]]
+        assert list(df["region_j_name"]) == ["B", "region_3", "region_3"]
+        assert list(df["weight"]) == [1.0, 2.0, 5.0]
+        assert set(df["subject"]) == {"sub-001"}
+
     def test_skips_missing_sidecar(self, tmp_path):
         """CSV without a JSON sidecar should be skipped with a warning."""
         from qsiparc.discover import BIDSFile, parse_entities
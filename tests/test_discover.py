@@ -107,6 +107,23 @@ class TestLoadLutForDseg:
         assert len(lut) == 5
         assert lut[1].name.startswith("region_")
 
+    def test_fallback_sparse_and_negative_labels(self, tmp_path):
+        import nibabel as nib
+        import numpy as np
+
+        from qsiparc.atlas import load_lut_from_dseg
+
+        data = np.zeros((4, 4, 4), dtype=np.int16)
+        data[0, 0, :] = 7
+        data[1, 1, :] = 3
+        path = tmp_path / "sparse_dseg.nii.gz"
+        nib.save(nib.Nifti1Image(data, np.eye(4)), path)
+        assert load_lut_from_dseg(path).indices == [3, 7]
+
+        data[2, 2, 0] = -1
+        nib.save(nib.Nifti1Image(data, np.eye(4)), path)
+        assert load_lut_from_dseg(path).indices == [-1, 3, 7]
+
 
 class TestDiscoverDsegFiles:
     def test_find_all(self, bids_tree):
@@ -136,6 +153,18 @@ class TestDiscoverDsegFiles:
         files = discover_dseg_files(bids_tree["root"], participant_label="001")
         assert len(files) == 1
 
+    def test_lut_shared_across_subjects(self, bids_tree):
+        import shutil
+
+        src = bids_tree["dseg"]
+        dwi_dir = bids_tree["root"] / "sub-002" / "ses-01" / "dwi"
+        dwi_dir.mkdir(parents=True)
+        shutil.copy(src, dwi_dir / src.name.replace("sub-001", "sub-002"))
+
+        files = discover_dseg_files(bids_tree["root"])
+        assert [f.subject for f in files] == ["001", "002"]
+        assert files[0].lut_path == files[1].lut_path == bids_tree["lut"]
+
 
 class TestDiscoverScalarMaps:
     def test_find_all(self, bids_tree):
@@ -152,6 +181,13 @@ class TestDiscoverScalarMaps:
         assert len(files) == 1
         assert "FA" in files[0].path.name
 
+    def test_filter_scalars_case_insensitive(self, bids_tree):
+        files = discover_scalar_maps(
+            bids_tree["root"], "sub-001", "ses-01", scalars=["fA"]
+        )
+        assert len(files) == 1
+        assert files[0].entities.get("param") == "FA"
+
     def test_entities_parsed(self, bids_tree):
         files = discover_scalar_maps(
             bids_tree["root"], "sub-001", "ses-01", scalars=["FA"]
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import numpy as np
+import pandas as pd
 import pytest
 
-from qsiparc.extract import extract_scalar_map, merge_extraction_results
+from qsiparc.extract import (
+    extract_scalar_map,
+    load_dseg_image,
+    merge_extraction_results,
+)
 
 
 class TestExtractScalarMap:
@@ -47,6 +52,78 @@ class TestExtractScalarMap:
             if row["voxel_count"] > 0:
                 assert row["mean"] == pytest.approx(0.55, abs=0.01)
 
+    @pytest.mark.parametrize(
+        "dtype,expected", [(np.float32, np.float32), (np.int16, np.float64)]
+    )
+    def test_zero_is_missing_dtype(
+        self, dtype, expected, five_region_lut, synthetic_dseg, monkeypatch
+    ):
+        import nibabel as nib
+
+        import qsiparc.extract as extract_module
+
+        seen = []
+
+        class SpyParcellator(extract_module.VolumetricParcellator):
+            def transform(self, scalar_img):
+                seen.append(np.asarray(scalar_img.dataobj).dtype)
+                return super().transform(scalar_img)
+
+        monkeypatch.setattr(extract_module, "VolumetricParcellator", SpyParcellator)
+
+        data = np.full((10, 10, 10), 2, dtype=dtype)
+        data[0, :5, 0] = 0  # half of region 1's first slice has no signal
+        img = nib.Nifti1Image(data, np.eye(4))
+        result = extract_scalar_map(
+            img, synthetic_dseg, five_region_lut, "FA", zero_is_missing=True
+        )
+        # float32 maps are masked without a float64 copy; int maps need NaN
+        assert seen == [np.dtype(expected)]
+        df = result.stats_df.set_index("index")
+        assert df.loc[1, "mean"] == pytest.approx(2.0)
+        assert np.asarray(img.dataobj)[0, 0, 0] == 0  # input image is not modified
+
+    def test_scalar_map_read_once(self, five_region_lut, bids_tree, monkeypatch):
+        from nibabel.arrayproxy import ArrayProxy
+
+        reads = []
+        get_scaled = ArrayProxy._get_scaled
+
+        def counting_get_scaled(self, *args, **kwargs):
+            reads.append(self.file_like)
+            return get_scaled(self, *args, **kwargs)
+
+        monkeypatch.setattr(ArrayProxy, "_get_scaled", counting_get_scaled)
+        dseg_img = load_dseg_image(bids_tree["dseg"])
+        reads.clear()
+        extract_scalar_map(bids_tree["scalar_fa"], dseg_img, five_region_lut, "FA")
+        # Only parcellate reads the (3D, unmasked) scalar map's voxels.
+        assert len(reads) == 1
+
+    def test_4d_scalar_uses_first_volume(self, five_region_lut, synthetic_dseg):
+        import nibabel as nib
+
+        data = np.stack(
+            [np.full((10, 10, 10), 0.5), np.full((10, 10, 10), 9.0)], axis=-1
+        ).astype(np.float32)
+        img = nib.Nifti1Image(data, np.eye(4))
+        result = extract_scalar_map(img, synthetic_dseg, five_region_lut, "FA")
+        assert all(result.stats_df["mean"].between(0.49, 0.51))
+
+    def test_preloaded_dseg_reused(self, five_region_lut, bids_tree):
+        dseg_img = load_dseg_image(bids_tree["dseg"])
+        assert isinstance(dseg_img.dataobj, np.ndarray)
+
+        from_path = extract_scalar_map(
+            bids_tree["scalar_fa"], bids_tree["dseg"], five_region_lut, "FA"
+        )
+        for scalar in ("scalar_fa", "scalar_md"):
+            extract_scalar_map(bids_tree[scalar], dseg_img, five_region_lut, "X")
+        from_img = extract_scalar_map(
+            bids_tree["scalar_fa"], dseg_img, five_region_lut, "FA"
+        )
+        pd.testing.assert_frame_equal(from_img.stats_df, from_path.stats_df)
+
     def test_shape_mismatch_raises(self, five_region_lut, synthetic_dseg):
         import nibabel as nib
 